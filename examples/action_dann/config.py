@@ -2,6 +2,7 @@
 Default configurations for action recognition domain adaptation
 """
 
+import functools
 import os
 
 from yacs.config import CfgNode
@@ -75,5 +76,15 @@ _C.OUTPUT.PB_FRESH = 0  # 0 # 50 # 0 to disable  ; MAYBE make it a command line
 _C.OUTPUT.OUT_DIR = os.path.join("outputs", _C.DATASET.SOURCE + "2" + _C.DATASET.TARGET)
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
@@ -2,6 +2,8 @@
 Default configurations for the AVMNIST dataset using Multimodal Neural Network (MMNN).
 """
 
+import functools
+
 from yacs.config import CfgNode
 
 # -----------------------------------------------------------------------------
@@ -74,5 +76,15 @@ _C.OUTPUT.OUT_DIR = "./outputs"
 _C.OUTPUT.PB_FRESH = 50  # Number of steps before a new progress bar is printed. Set 0 to disable the progress bar.
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
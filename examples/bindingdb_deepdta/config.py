@@ -2,6 +2,8 @@
 Default configurations for the BindingDB datasets using DeepDTA.
 """
 
+import functools
+
 from yacs.config import CfgNode
 
 # -----------------------------------------------------------------------------
@@ -48,5 +50,15 @@ _C.SOLVER.TRAIN_BATCH_SIZE = 256
 _C.SOLVER.TEST_BATCH_SIZE = 256
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
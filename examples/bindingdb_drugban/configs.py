@@ -1,3 +1,5 @@
+import functools
+
 from yacs.config import CfgNode
 
 _C = CfgNode()
@@ -90,5 +92,15 @@ _C.COMET.API_KEY = ""  # Use your own Comet API key. Generate the key at https:/
 # ---------------------------------------------------------------------------- #
 # Function to return a clone of the default config
 # ---------------------------------------------------------------------------- #
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
@@ -1,6 +1,8 @@
 """
 Hyperparameter configuration file based on the YACS library.
 """
+import functools
+
 from yacs.config import CfgNode
 
 _C = CfgNode()
@@ -79,5 +81,15 @@ _C.COMET.PROJECT_NAME = "CNN Transformer"
 _C.COMET.EXPERIMENT_NAME = "CNNTransformer"
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
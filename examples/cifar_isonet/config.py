@@ -3,6 +3,8 @@ Default configurations for image classification using ISONet,
 based on https://github.com/HaozhiQi/ISONet/blob/master/isonet/utils/config.py
 """
 
+import functools
+
 from yacs.config import CfgNode
 
 # -----------------------------------------------------------------------------
@@ -66,5 +68,15 @@ _C.OUTPUT = CfgNode()
 _C.OUTPUT.OUT_DIR = "./outputs"
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
@@ -2,6 +2,8 @@
 Default configurations for cardiac MRI data (ShefPAH) processing and classification
 """
 
+import functools
+
 from yacs.config import CfgNode
 
 # -----------------------------------------------------------------------------
@@ -67,5 +69,15 @@ _C.SAVE_FIG_KWARGS.format = "pdf"
 _C.SAVE_FIG_KWARGS.bbox_inches = "tight"
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
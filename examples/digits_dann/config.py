@@ -1,6 +1,8 @@
 """
 Default configurations for domain adaptation
 """
+import functools
+
 from yacs.config import CfgNode
 
 # -----------------------------------------------------------------------------
@@ -75,5 +77,15 @@ _C.COMET.PROJECT_NAME = "Digit DANN"
 _C.COMET.EXPERIMENT_NAME = "DigitDANN"
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
@@ -1,6 +1,8 @@
 """
 Default configurations for prototypical networks
 """
+import functools
+
 from yacs.config import CfgNode
 
 # ---------------------------------------------------------------------------- #
@@ -50,5 +52,15 @@ _C.OUTPUT.SAVE_TOP_K = 1
 _C.OUTPUT.SAVE_LAST = True
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
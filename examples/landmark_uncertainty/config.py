@@ -4,6 +4,8 @@ See the documentation for full information on the configuration file options:
 pykale/examples/landmark_uncertainty/README.md
 """
 
+import functools
+
 from yacs.config import CfgNode
 
 # -----------------------------------------------------------------------------
@@ -111,5 +113,15 @@ _C.OUTPUT.SAVE_PREPEND = "example"
 _C.OUTPUT.SAVE_FIGURES = True  # True to save, False to visualize in matplotlib
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
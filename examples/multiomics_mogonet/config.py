@@ -5,6 +5,8 @@ graph convolutional networks allowing patient classification and biomarker ident
 
 https://github.com/txWang/MOGONET/blob/main/main_mogonet.py
 """
+import functools
+
 from yacs.config import CfgNode
 
 # ---------------------------------------------------------
@@ -54,5 +56,15 @@ _C.OUTPUT = CfgNode()
 _C.OUTPUT.OUT_DIR = "./outputs"
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
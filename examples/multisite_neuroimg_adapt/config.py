@@ -2,6 +2,8 @@
 Default configurations for classification on resting-state fMRI of ABIDE
 """
 
+import functools
+
 from yacs.config import CfgNode
 
 # -----------------------------------------------------------------------------
@@ -39,5 +41,15 @@ _C.OUTPUT = CfgNode()
 _C.OUTPUT.OUT_DIR = "./outputs"  # output_dir
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
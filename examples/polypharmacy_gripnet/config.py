@@ -1,6 +1,8 @@
 """
 Default configurations for Polypharmacy Side Effect Prediction using GripNet
 """
+import functools
+
 from yacs.config import CfgNode
 
 # ---------------------------------------------------------
@@ -53,5 +55,15 @@ _C.OUTPUT = CfgNode()
 _C.OUTPUT.OUT_DIR = "./outputs"
 
 
+@functools.lru_cache(maxsize=1)
+def _frozen_defaults():
+    """Build and freeze the default config once; read-only callers can share this copy."""
+    cfg = _C.clone()
+    cfg.freeze()
+    return cfg
+
+
 def get_cfg_defaults():
-    return _C.clone()
+    cfg = _frozen_defaults().clone()
+    cfg.defrost()
+    return cfg
@@ -35,14 +35,14 @@ def cross_entropy_logits(output, target, weights=None):
         See DANN, WDGRL, and MMD trainers in kale.pipeline.domain_adapter
     """
 
-    class_output = F.log_softmax(output, dim=1)
-    max_class = class_output.max(1)
-    y_hat = max_class[1]  # get the index of the max log-probability
-    is_correct = y_hat.eq(target.view(target.size(0)).type_as(y_hat))
+    flat_target = target.reshape(-1).long().to(output.device)
+    # log_softmax is monotonic, so the argmax of the logits already gives the predicted class.
+    y_hat = output.argmax(dim=1)
+    is_correct = y_hat.eq(flat_target)
+    losses = F.cross_entropy(output, flat_target, reduction="none")
     if weights is None:
-        loss = nn.NLLLoss()(class_output, target.type_as(y_hat).view(target.size(0)))
+        loss = losses.mean()
     else:
-        losses = nn.NLLLoss(reduction="none")(class_output, target.type_as(y_hat).view(target.size(0)))
         loss = torch.sum(weights * losses) / torch.sum(weights)
     return loss, is_correct
 
@@ -144,17 +144,19 @@ def multitask_topk_accuracy(output, target, topk=(1,)):
     return result
 
 
+@torch.jit.script
 def entropy_logits(linear_output):
     """Computes entropy logits in CDAN with entropy conditioning (CDAN+E)
 
     Examples:
         See CDANTrainer in kale.pipeline.domain_adapter
     """
-    p = F.softmax(linear_output, dim=1)
-    loss_ent = -torch.sum(p * (torch.log(p + 1e-5)), dim=1)
+    log_p = F.log_softmax(linear_output, dim=1)
+    loss_ent = -torch.sum(log_p.exp() * log_p, dim=1)
     return loss_ent
 
 
+@torch.jit.script
 def entropy_logits_loss(linear_output):
     """Computes entropy logits loss in semi-supervised or few-shot domain adaptation
 
@@ -171,9 +173,7 @@ def gradient_penalty(critic, h_s, h_t):
         See WDGRLTrainer and WDGRLTrainerMod in kale.pipeline.domain_adapter
     """
 
-    alpha = torch.rand(h_s.size(0), 1)
-    alpha = alpha.expand(h_s.size()).type_as(h_s)
-    # try:
+    alpha = torch.rand(h_s.size(0), 1, device=h_s.device, dtype=h_s.dtype)
     differences = h_t - h_s
 
     interpolates = h_s + (alpha * differences)
@@ -185,12 +185,11 @@ def gradient_penalty(critic, h_s, h_t):
         interpolates,
         grad_outputs=torch.ones_like(preds),
         retain_graph=True,
-        create_graph=True,
+        # The double-backward graph is only needed when the penalty itself is optimized.
+        create_graph=critic.training,
     )[0]
-    gradient_norm = gradients.norm(2, dim=1)
+    gradient_norm = torch.linalg.vector_norm(gradients, dim=1)
     gradient_penalty = ((gradient_norm - 1) ** 2).mean()
-    # except:
-    #     gradient_penalty = 0
 
     return gradient_penalty
 
@@ -203,44 +202,40 @@ def gaussian_kernel(source, target, kernel_mul=2.0, kernel_num=5, fix_sigma=None
     Examples:
         See DANTrainer and JANTrainer in kale.pipeline.domain_adapter
     """
-    n_samples = int(source.size()[0]) + int(target.size()[0])
+    n_samples = source.size(0) + target.size(0)
     total = torch.cat([source, target], dim=0)
-    total0 = total.unsqueeze(0).expand(int(total.size(0)), int(total.size(0)), int(total.size(1)))
-    total1 = total.unsqueeze(1).expand(int(total.size(0)), int(total.size(0)), int(total.size(1)))
-    l2_distance = ((total0 - total1) ** 2).sum(2)
+    l2_distance = torch.cdist(total, total, p=2).pow(2)
     if fix_sigma:
         bandwidth = fix_sigma
     else:
-        bandwidth = torch.sum(l2_distance.data) / (n_samples**2 - n_samples)
+        bandwidth = l2_distance.detach().sum() / (n_samples**2 - n_samples)
     bandwidth /= kernel_mul ** (kernel_num // 2)
-    bandwidth_list = [bandwidth * (kernel_mul**i) for i in range(kernel_num)]
-    kernel_val = [torch.exp(-l2_distance / bandwidth_temp) for bandwidth_temp in bandwidth_list]
-    return sum(kernel_val)  # /len(kernel_val)
+    bandwidths = bandwidth * kernel_mul ** torch.arange(kernel_num, device=total.device, dtype=total.dtype)
+    return torch.exp(-l2_distance.unsqueeze(0) / bandwidths.view(-1, 1, 1)).sum(0)
 
 
-def compute_mmd_loss(kernel_values, batch_size):
+@torch.jit.script
+def compute_mmd_loss(kernel_values, batch_size: int):
     """Computes the Maximum Mean Discrepancy (MMD) between domains.
 
     Examples:
         See DANTrainer and JANTrainer in kale.pipeline.domain_adapter
     """
-    loss = 0
-    for i in range(batch_size):
-        s1, s2 = i, (i + 1) % batch_size
-        t1, t2 = s1 + batch_size, s2 + batch_size
-        loss += kernel_values[s1, s2] + kernel_values[t1, t2]
-        loss -= kernel_values[s1, t2] + kernel_values[s2, t1]
-    return loss / float(batch_size)
+    s1 = torch.arange(batch_size, device=kernel_values.device)
+    s2 = (s1 + 1) % batch_size
+    t1 = s1 + batch_size
+    t2 = s2 + batch_size
+    loss = (kernel_values[s1, s2] + kernel_values[t1, t2] - kernel_values[s1, t2] - kernel_values[s2, t1]).sum()
+    return loss / batch_size
 
 
-def hsic(kx, ky, device):
+def hsic(kx, ky):
     """
     Perform independent test with Hilbert-Schmidt Independence Criterion (HSIC) between two sets of variables x and y.
 
     Args:
         kx (2-D tensor): kernel matrix of x, shape (n_samples, n_samples)
         ky (2-D tensor): kernel matrix of y, shape (n_samples, n_samples)
-        device (torch.device): the desired device of returned tensor
 
     Returns:
         [tensor]: Independent test score >= 0
@@ -255,10 +250,17 @@ def hsic(kx, ky, device):
     n = kx.shape[0]
     if ky.shape[0] != n:
         raise ValueError("kx and ky are expected to have the same sample sizes.")
-    ctr_mat = torch.eye(n, device=device) - torch.ones((n, n), device=device) / n
-    return torch.trace(torch.mm(torch.mm(torch.mm(kx, ctr_mat), ky), ctr_mat)) / (n**2)
+    # Double-centering via row/column means is equivalent to H @ k @ H with H = I - 1/n,
+    # and trace(kx_c @ ky_c) = sum(kx_c * ky_c) for symmetric kernel matrices.
+    kx_c = kx - kx.mean(dim=0, keepdim=True) - kx.mean(dim=1, keepdim=True) + kx.mean()
+    if kx is ky:
+        # Self-dependence: both factors are the same centered kernel.
+        return kx_c.pow(2).sum() / (n**2)
+    ky_c = ky - ky.mean(dim=0, keepdim=True) - ky.mean(dim=1, keepdim=True) + ky.mean()
+    return (kx_c * ky_c).sum() / (n**2)
 
 
+@torch.jit.script
 def euclidean(x1, x2):
     """
     Compute the Euclidean distance between two sets of variables.
@@ -270,7 +272,7 @@ def euclidean(x1, x2):
     Returns:
         torch.Tensor: Euclidean distance
     """
-    return ((x1 - x2) ** 2).sum().sqrt()
+    return torch.linalg.vector_norm(x1 - x2)
 
 
 def _moment_k(x: torch.Tensor, domain_labels: torch.Tensor, k_order=2):
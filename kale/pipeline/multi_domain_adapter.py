@@ -249,7 +249,7 @@ class _DINTrainer(BaseMultiSourceTrainer):
         domain_label_mat = one_hot(domain_labels, num_classes=self.n_domains)
         domain_label_mat = domain_label_mat.float()
         ky = torch.mm(domain_label_mat, domain_label_mat.T)
-        return losses.hsic(kx, ky, device=self.device)
+        return losses.hsic(kx, ky)
 
 
 class MFSANTrainer(BaseMultiSourceTrainer):
@@ -24,6 +24,18 @@ def office_path(download_path):
     return path_
 
 
+# Builds each Office dataset access once per session so parametrized tests share them
+@pytest.fixture(scope="session")
+def office_access(office_path):
+    from kale.loaddata.image_access import ImageAccess
+
+    kwargs = {"download": False, "return_domain_label": True}
+    return {
+        "office31": ImageAccess.get_multi_domain_images("OFFICE31", office_path, **kwargs),
+        "office_caltech": ImageAccess.get_multi_domain_images("OFFICE_CALTECH", office_path, **kwargs),
+    }
+
+
 # Downloads and unzips remote file
 @pytest.fixture(scope="session")
 def landmark_uncertainty_tuples_path(download_path):
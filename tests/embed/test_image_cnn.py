@@ -17,8 +17,6 @@ from kale.embed.image_cnn import (
 
 BATCH_SIZE = 64
 
-# the default input shape is batch_size * num_channel * height * weight
-INPUT_BATCH = torch.randn(BATCH_SIZE, 3, 32, 32)
 PARAM = [
     (ResNet18Feature, 512),
     (ResNet34Feature, 512),
@@ -28,28 +26,42 @@ PARAM = [
 ]
 
 
-def test_smallcnnfeature_shapes():
+# the default input shape is batch_size * num_channel * height * weight
+@pytest.fixture(scope="module")
+def input_batch():
+    return torch.randn(BATCH_SIZE, 3, 32, 32)
+
+
+# Builds each ResNet backbone once per module instead of once per parametrization
+@pytest.fixture(scope="module")
+def resnet_models():
+    return {model_cls: model_cls(weights="DEFAULT").eval() for model_cls, _ in PARAM}
+
+
+def test_smallcnnfeature_shapes(input_batch):
     model = SmallCNNFeature()
     model.eval()
-    output_batch = model(INPUT_BATCH)
+    with torch.inference_mode():
+        output_batch = model(input_batch)
     assert output_batch.size() == (BATCH_SIZE, 128)
 
 
-def test_simplecnnbuilder_shapes():
+def test_simplecnnbuilder_shapes(input_batch):
     model = SimpleCNNBuilder(
         conv_layers_spec=[[16, 3], [32, 3], [64, 3], [32, 1], [64, 3], [128, 3], [256, 3], [64, 1]]
     )
     model.eval()
-    output_batch = model(INPUT_BATCH)
+    with torch.inference_mode():
+        output_batch = model(input_batch)
     assert output_batch.size() == (BATCH_SIZE, 64, 8, 8)
 
 
 @pytest.mark.parametrize("param", PARAM)
-def test_shapes(param):
-    model, out_size = param
-    model = model(weights="DEFAULT")
-    model.eval()
-    output_batch = model(INPUT_BATCH)
+def test_shapes(param, resnet_models, input_batch):
+    model_cls, out_size = param
+    model = resnet_models[model_cls]
+    with torch.inference_mode():
+        output_batch = model(input_batch)
     assert output_batch.size() == (BATCH_SIZE, out_size)
     assert model.output_size() == out_size
 
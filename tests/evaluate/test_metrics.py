@@ -2,10 +2,12 @@ import random
 
 import pytest
 import torch
+from torch.nn import functional as F
 
 from kale.evaluate.metrics import (
     binary_cross_entropy,
     calculate_distance,
+    cross_entropy_logits,
     DistanceMetric,
     multitask_topk_accuracy,
     protonet_loss,
@@ -41,6 +43,21 @@ MULTI_PREDS = (FIRST_PREDS, SECOND_PREDS)
 MULTI_LABELS = (FIRST_LABELS, SECOND_LABELS)
 
 
+def test_cross_entropy_logits():
+    # Predictions must match the argmax of the raw logits, and the loss the fused cross-entropy
+    loss, is_correct = cross_entropy_logits(FIRST_PREDS, FIRST_LABELS)
+    assert torch.equal(is_correct, FIRST_PREDS.argmax(dim=1).eq(FIRST_LABELS))
+    assert torch.isclose(loss, F.cross_entropy(FIRST_PREDS, FIRST_LABELS))
+
+
+def test_cross_entropy_logits_weighted():
+    weights = torch.tensor([1.0, 2.0, 3.0, 4.0, 5.0])
+    loss, is_correct = cross_entropy_logits(FIRST_PREDS, FIRST_LABELS, weights=weights)
+    losses = F.cross_entropy(FIRST_PREDS, FIRST_LABELS, reduction="none")
+    assert torch.isclose(loss, (weights * losses).sum() / weights.sum())
+    assert torch.equal(is_correct, FIRST_PREDS.argmax(dim=1).eq(FIRST_LABELS))
+
+
 def test_topk_accuracy():
     # Test topk_accuracy with single-task input
     preds = FIRST_PREDS
@@ -10,13 +10,11 @@ from kale.loaddata.multi_domain import BiDomainDatasets, DomainsDatasetBase, Mul
 
 
 @pytest.mark.parametrize("test_on_all", [True, False])
-def test_office31(office_path, test_on_all):
-    office_access = ImageAccess.get_multi_domain_images(
-        "OFFICE31", office_path, download=False, return_domain_label=True
-    )
-    testing.assert_equal(len(office_access.class_to_idx), 31)
-    testing.assert_equal(len(office_access.domain_to_idx), 3)
-    dataset = MultiDomainDataset(office_access, test_on_all=test_on_all)
+def test_office31(office_access, test_on_all):
+    office31_access = office_access["office31"]
+    testing.assert_equal(len(office31_access.class_to_idx), 31)
+    testing.assert_equal(len(office31_access.domain_to_idx), 3)
+    dataset = MultiDomainDataset(office31_access, test_on_all=test_on_all)
     dataset.prepare_data_loaders()
     domain_labels = list(dataset.domain_to_idx.values())
     for split in ["train", "valid", "test"]:
@@ -26,12 +24,10 @@ def test_office31(office_path, test_on_all):
             testing.assert_equal(y[z == domain_label_].shape[0], 10)
 
 
-def test_office_caltech(office_path):
-    office_access = ImageAccess.get_multi_domain_images(
-        "OFFICE_CALTECH", office_path, download=False, return_domain_label=True
-    )
-    testing.assert_equal(len(office_access.class_to_idx), 10)
-    testing.assert_equal(len(office_access.domain_to_idx), 4)
+def test_office_caltech(office_access):
+    office_caltech_access = office_access["office_caltech"]
+    testing.assert_equal(len(office_caltech_access.class_to_idx), 10)
+    testing.assert_equal(len(office_caltech_access.domain_to_idx), 4)
 
 
 @pytest.mark.parametrize("split_ratio", [0.9, 1])